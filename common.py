@@ -1,6 +1,9 @@
 import os
+import re
 from sys import stderr
 from datetime import datetime
+from functools import lru_cache
+from typing import Optional
 import importlib
 import pickle, pathlib
 
@@ -42,6 +45,50 @@ def unescape(s: str) -> str:
 
 
 
+_re_replacement_escape = re.compile(r"\\([\\s#])")
+_replacement_escapes = {"\\": "\\", "s": " ", "#": "#"}
+
+
+def unescape_replacement(s: str) -> str:
+    """ Decodes a key or value of a replacement table (replace and 
+        multi_replace) in a single pass. The escape character is \\ and
+        the following escape sequences are supported:
+        \\\\  => \\
+        \\s  => <space>
+        \\#  => #
+    """
+    return _re_replacement_escape.sub(
+        lambda m: _replacement_escapes[m.group(1)], s)
+
+
+_ascii_char_classes = {
+    # For ASCII strings, the following character classes are equivalent
+    # to the respective str predicates (e.g., "lower" and str.islower).
+    "lower": "[a-z]",
+    "upper": "[A-Z]",
+    "numeric": "[0-9]",
+    "non_numeric": "[^0-9]",
+    "letter": "[a-zA-Z]",
+    "symbol": "[^a-zA-Z0-9]",
+    "non_letter": "[^a-zA-Z]"
+}
+
+
+@lru_cache(maxsize=None)
+def get_ascii_char_class_deletechars(char_class: str) -> Optional[bytes]:
+    """ Returns the ASCII chars which do not belong to the given class; None
+        if the class is not supported. The number of chars of the class in
+        an ASCII string s is then given by:
+            len(s.encode("ascii").translate(None, deletechars))
+        I.e., the chars are counted by C-level loops.
+    """
+    regexp = _ascii_char_classes.get(char_class)
+    if regexp is None:
+        return None
+    pattern = re.compile(regexp)
+    return bytes(c for c in range(128) if not pattern.match(chr(c)))
+
+
 def locate_resource(filename: str) -> str:
     """ Tries to locate the file by searching for it relative to the current
         folder or the folder where this python script is stored unless the 
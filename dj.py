@@ -51,12 +51,16 @@ def transform_entries(td_unit: TDUnit, dictionary_filename: str, report_pace: bo
     start = time()
     last_count = 0
     it = chain(generators, d_in)
+    # The bound methods are looked up once; this loop is executed for
+    # every entry.
+    next_entry = it.__next__
+    process = td_unit.process
     while (True):
         try:
             count = count + 1
-            entry = it.__next__()
+            entry = next_entry()
             sentry = entry.rstrip("\r\n")
-            td_unit.process(count, sentry)
+            process(count, sentry)
             if report_pace and time()-start > 5:
                 msg = f"[info] processed: {count}; speed: {(count-last_count)//(time()-start)} entries per second"
                 print(msg, file=stderr)
@@ -422,7 +422,22 @@ class ConfigureOperation(ASTNode):
         op_class_name = "".join(
             map(lambda x: x.capitalize(), self.module_name.split("_"))
         )
-        op_class = getattr(op_module, op_class_name)
+        op_class = getattr(op_module, op_class_name, None)
+        if op_class is None:
+            # Some class names do not follow the naming scheme (e.g.,
+            # RemoveSC); in that case the class is identified using
+            # the name of the operation.
+            op_class = next(
+                (c for c in vars(op_module).values()
+                 if isinstance(c, type) and issubclass(c, Operation) and
+                 c.__module__ == op_module.__name__ and
+                 c.op_name() == self.module_name),
+                None
+            )
+        if op_class is None:
+            msg = f"{self}: unknown operation {self.module_name}"
+            raise InitializationFailed(msg)
+        op_class_name = op_class.__name__
         value = None
         try:
             old_value = getattr(op_class, self.field_name)
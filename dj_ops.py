@@ -40,14 +40,18 @@ class ProcessEntriesHandler(ABC):
         ignored_entries = td_unit.ignored_entries
         all_none = True
         all_new_entries = []
+        # The loop is executed for each entry of each operation; hence,
+        # all lookups which do not depend on the entry are hoisted.
+        process = self.process
+        append = all_new_entries.append
         for entry in entries:
-            new_entries = self.process(entry)
+            new_entries = process(entry)
             if new_entries is not None:
                 all_none = False
                 for new_e in new_entries:
                     if not new_e in ignored_entries:
                         if len(new_e) > 0:
-                            all_new_entries.append(new_e)
+                            append(new_e)
                     elif td_unit.trace_ops:
                         td_unit.trace(f"ignored derived entry: {new_e}")
         if all_none:
@@ -47,27 +47,31 @@ class CorrectSpelling(PerEntryTransformer):
         advanced handling regarding the usage of upper letters.
         """
         case_folded_entry = entry.lower()
+        entry_len = len(entry)
+        max_edit_distance = CorrectSpelling.MAX_EDIT_DISTANCE
+        if self.USE_DAMERAU_LEVENSHTEIN:
+            edit_distance = damerau_levenshtein_distance
+        else:
+            edit_distance = levenshtein_distance
         words = set()
         for d in self.dictionaries:
             for s in d.suggest(entry):
-                if self.USE_DAMERAU_LEVENSHTEIN:
-                    edit_distance = damerau_levenshtein_distance(entry, s)
-                else:
-                    edit_distance = levenshtein_distance(entry, s)
-
-                if edit_distance == 0:
-                    # The word was correct...
+                if s == entry:
+                    # The word was correct (edit distance 0)...
                     return []
                 elif case_folded_entry == s.lower():
                     # We (always) accept greater edit distances, but if and
                     # only if it is due to capitalization issues...
                     return [s]
-                elif edit_distance <= CorrectSpelling.MAX_EDIT_DISTANCE:
-                    if self.FILTER_CORRECTIONS_WITH_SPACE and \
-                            s.find(" ") != -1:
-                        pass
-                    else:
-                        words.add(s)
+                elif abs(len(s) - entry_len) > max_edit_distance:
+                    # The edit distance is at least the difference of the
+                    # lengths; hence, it does not need to be computed.
+                    pass
+                elif self.FILTER_CORRECTIONS_WITH_SPACE and \
+                        s.find(" ") != -1:
+                    pass
+                elif edit_distance(entry, s) <= max_edit_distance:
+                    words.add(s)
 
         if len(words) == 0:
             return None
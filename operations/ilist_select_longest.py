@@ -14,29 +14,22 @@ class IListSelectLongest(Filter):
 
     def process_entries(self, entries: list[str]) -> list[str]:
         # Precondition: entries is a list of unique entries!
-        if len(entries) == 1:
+        if len(entries) <= 1:
             return entries
 
-        longest_entries = []
-        for e in entries:
-            if not longest_entries:
-                longest_entries = [e]
+        longest_entries = [entries[0]]
+        for e in entries[1:]:
+            # The generator stops at the first previously identified
+            # word which contains e.
+            if any(e in le for le in longest_entries):
                 continue
 
-            if not any([True for le in longest_entries if e in le]):
-                # e is not in any previously identified word...
-                replaced = False
-                for i in range(0,len(longest_entries)):
-                    if longest_entries[i] in e:
-                        # e is longer than a previous word...
-                        new_longest_entries = longest_entries[0:i]
-                        new_longest_entries.extend(longest_entries[i+1:len(longest_entries)])
-                        new_longest_entries.append(e)
-                        longest_entries = new_longest_entries
-                        replaced = True
-                        break
-                if not replaced:
-                    longest_entries.append(e)
+            for i, le in enumerate(longest_entries):
+                if le in e:
+                    # e is longer than a previous word...
+                    del longest_entries[i]
+                    break
+            longest_entries.append(e)
 
         return longest_entries
 
@@ -5,6 +5,25 @@ from dj_ops import PerEntryTransformer, TDUnit, ASTNode
 from common import InitializationFailed
 
 
+# German dates (<day>.<month>.<year>) and English dates
+# (<month>/<day>/<year>) are matched using a single regular expression;
+# the German alternative is tried first. The match function is bound at
+# module level to avoid the attribute lookups per entry.
+_match_date = re.compile(
+    r"[^0-9]*(?:" +
+    r"(?P<gd>[0-9]{1,2})\.?(?P<gm>[0-9]{1,2})\.?(?P<gc>19|20)?(?P<gy>[0-9]{2})" +
+    r"|" +
+    r"(?P<em>[0-9]{1,2})[/-]?(?P<ed>[0-9]{1,2})[/-]?(?P<ec>19|20)?(?P<ey>[0-9]{2})" +
+    r")").match
+
+# The value at index <day>*100+<month> is 1 iff the day is in the
+# range [1,31] and the month is in the range [1,12].
+_valid_day_and_month = bytes(
+    1 if 1 <= dm // 100 <= 31 and 1 <= dm % 100 <= 12 else 0
+    for dm in range(100*100)
+)
+
+
 class MangleDates(PerEntryTransformer):
     """ Tries to identify numbers which are dates and then creates various
         representations for the respective date.
@@ -12,13 +31,6 @@ class MangleDates(PerEntryTransformer):
         Currently, we try to identify 1st german and then 2nd english dates.
     """
 
-    _re_german_date = \
-        re.compile("[^0-9]*([0-9]{1,2})\.?([0-9]{1,2})\.?(19|20)?([0-9]{2})")
-    
-    _re_english_date = \
-        re.compile(
-            "[^0-9]*([0-9]{1,2})[/-]?([0-9]{1,2})[/-]?(19|20)?([0-9]{2})")
-
     def op_name() -> str: return "mangle_dates"
 
     START_YEAR_20TH = 75
@@ -35,28 +47,35 @@ class MangleDates(PerEntryTransformer):
             raise InitializationFailed(
                 f"{self}: 19{self.START_YEAR_20TH} has to be < 20{self.END_YEAR_21ST}"
             )
+        # The configuration is fixed after initialization; hence, we
+        # cache the values to avoid the class attribute lookups per entry.
+        self._start_year_20th = int(self.START_YEAR_20TH)
+        self._end_year_21st = int(self.END_YEAR_21ST)
+        self._print_single_digit_days = self.PRINT_SINGLE_DIGIT_DAYS
 
     def process(self, entry: str) -> list[str]:
-        r = MangleDates._re_german_date.match(entry)
-        if r:
-            (d, m, c, y) = r.groups()
-        else:
-            r = MangleDates._re_english_date.match(entry)
-            if r:
-                (m, d, c, y) = r.groups()
+        # A date consists of at least four digits (<d><m><yy>).
+        if len(entry) < 4:
+            return None
 
+        r = _match_date(entry)
         if not r:
             return None
 
+        (d, m, c, y, em, ed, ec, ey) = r.groups()
+        if d is None:
+            # it is an english date
+            (d, m, c, y) = (ed, em, ec, ey)
+
         """ Currently we only accept dates between 19START_YEAR and 20ENDYEAR.
             The test ist not extremely precise, but should be acceptable for
             our purposes.
         """
-        if int(d) > 31 or int(d) == 0 or \
-            int(m) > 12 or int(m) == 0 or \
-            (int(y) > self.END_YEAR_21ST and
-                int(y) < self.START_YEAR_20TH) or \
-                (c and (c == 19 or c == 20)):
+        di = int(d)
+        mi = int(m)
+        yi = int(y)
+        if not _valid_day_and_month[di*100+mi] or \
+            (yi > self._end_year_21st and yi < self._start_year_20th):
             # We have to return "None", because we don't consider the
             # current number to be a date!
             return None
@@ -66,31 +85,24 @@ class MangleDates(PerEntryTransformer):
             mangled_dates.append(d+m+c+y)
             mangled_dates.append(c+y)
         else:
-            if int(y) <= 25:
+            if yi <= 25:
                 mangled_dates.append("20"+y)
             else:
                 mangled_dates.append("19"+y)
 
-        if (len(d) == 1 or len(m) == 1) and MangleDates.PRINT_SINGLE_DIGIT_DAYS:
+        if (len(d) == 1 or len(m) == 1) and self._print_single_digit_days:
             mangled_dates.append(d+m+y)
 
-        if len(d) == 1:
-            if len(m) == 1:
-                mangled_dates.append("0"+d+"0"+m+y)
-                mangled_dates.append("0"+d+"0"+m)
-                mangled_dates.append("0"+m+"0"+d)
-            else:
-                mangled_dates.append("0"+d+m+y)
-                mangled_dates.append("0"+d+m)
-                mangled_dates.append(m+"0"+d)
-        else:
-            if len(m) == 1:
-                mangled_dates.append(d+"0"+m+y)
-                mangled_dates.append(d+"0"+m)
-                mangled_dates.append("0"+m+d)
-            else:
-                mangled_dates.append(d+m)
-                mangled_dates.append(m+d)
-
-        return mangled_dates
+        # The representations with two digit days and months.
+        dd = "0"+d if len(d) == 1 else d
+        mm = "0"+m if len(m) == 1 else m
+        ddmm = dd+mm
+        mangled_dates.append(ddmm+y)
+        mangled_dates.append(ddmm)
+        mangled_dates.append(mm+dd)
+
+        # Some representations are generated twice (e.g. <d><m><y> if
+        # the day or month has a single digit); dict.fromkeys removes
+        # the duplicates while preserving the order.
+        return list(dict.fromkeys(mangled_dates))
 
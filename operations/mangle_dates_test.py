@@ -0,0 +1,33 @@
+import unittest
+
+from operations.mangle_dates import MangleDates
+
+
+class TestMangleDates(unittest.TestCase):
+
+    def setUp(self):
+        self.md = MangleDates()
+        self.md.init(None, None)  # mangle_dates has no AST dependencies
+
+    def test_is_transformer(self):
+        self.assertTrue(self.md.is_transformer())
+
+    def test__str__(self):
+        self.assertEqual(self.md.__str__(), "mangle_dates")
+
+    def test_no_date(self):
+        self.assertIsNone(self.md.process("Test"))
+        self.assertIsNone(self.md.process("31.13.99"))
+        self.assertIsNone(self.md.process("12.05.50"))
+
+    def test_german_date(self):
+        self.assertListEqual(
+            self.md.process("12.05.1999"),
+            ["120599", "99", "12051999", "1999", "1205", "0512"]
+        )
+
+    def test_english_date(self):
+        self.assertListEqual(
+            self.md.process("5-12-85"),
+            ["12585", "85", "1985", "120585", "1205", "0512"]
+        )
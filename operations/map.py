@@ -1,9 +1,37 @@
+import re
+from itertools import chain, product
 
 from dj_ast import TDUnit, ASTNode
 from dj_ops import PerEntryTransformer
 from common import InitializationFailed, escape
 
 
+def _translate_process(table: dict):
+    """ Creates a process function that maps the chars using the given
+        translation table; all values are bound as locals of the function.
+    """
+    def process(entry: str, translate=str.translate) -> list[str]:
+        new_entry = translate(entry, table)
+        if new_entry == entry:
+            return None
+        return [new_entry]
+    return process
+
+
+def _single_target_process(re_mapped_chars: re.Pattern, target: str):
+    """ Creates a process function that replaces each char matched by the
+        given pattern by the target char.
+    """
+    split = re_mapped_chars.split
+    join = target.join
+    def process(entry: str) -> list[str]:
+        segments = split(entry)
+        if len(segments) == 1:
+            return None
+        return [join(segments)]
+    return process
+
+
 class Map(PerEntryTransformer):
     """ Maps each given character to one to several alternatives.
 
@@ -34,6 +62,13 @@ class Map(PerEntryTransformer):
         self.source_chars = set(source_chars)
         self.raw_target_chars = target_chars
         self.target_chars = set(target_chars)
+        # Matches the chars that will be mapped; initialized by init.
+        self._re_mapped_chars = None
+        # The translation table that is used if all source chars are
+        # mapped to the same char; initialized by init.
+        self._table = None
+        # The (unique) target chars in the given order; initialized by init.
+        self._targets = None
 
     def __str__(self):
         map_not = Map.op_name()
@@ -54,24 +89,38 @@ class Map(PerEntryTransformer):
         if not self.source_chars.isdisjoint(self.target_chars):
             msg = f'{self}: useless identity mapping {self.source_chars.intersection(self.target_chars)}"'
             raise InitializationFailed(msg)
-        return self
+        source_chars = re.escape(self.raw_source_chars)
+        if self.map_not:
+            self._re_mapped_chars = re.compile(f"[^{source_chars}]")
+        else:
+            self._re_mapped_chars = re.compile(f"[{source_chars}]")
+        self._targets = tuple(dict.fromkeys(self.raw_target_chars))
 
-    def process(self, entry: str) -> list[str]:
-        hit = False
-        new_entries = [""]
-        for e in entry:
-            in_source_chars = e in self.source_chars
-            if (in_source_chars and not self.map_not) or (not in_source_chars and self.map_not) :
-                hit = True
-                es = []
-                for t in self.raw_target_chars:
-                    for new_e in new_entries:
-                        es.append(new_e + t)
-                new_entries = es
+        # If there is only one target char, exactly one new entry is
+        # created; in this case we use a specialized implementation.
+        if len(self._targets) == 1:
+            if self.map_not:
+                self.process = _single_target_process(
+                    self._re_mapped_chars, self._targets[0])
             else:
-                new_entries = list(map(lambda new_e: new_e+e, new_entries))
+                self._table = str.maketrans(
+                    dict.fromkeys(self.source_chars, self._targets[0])
+                )
+                self.process = _translate_process(self._table)
+        return self
 
-        if hit:
-            return new_entries
-        else:
+    def process(self, entry: str) -> list[str]:
+        # The segments of the entry between the chars that are mapped.
+        segments = self._re_mapped_chars.split(entry)
+        if len(segments) == 1:
             return None
+
+        last_segment = segments.pop()
+        join = "".join
+        flatten = chain.from_iterable
+        # The targets are reversed to ensure that the target char of
+        # the first mapped char changes most often.
+        return [
+            join(flatten(zip(segments, reversed(targets)))) + last_segment
+            for targets in product(self._targets, repeat=len(segments))
+        ]
@@ -28,8 +28,27 @@ class TestMap(unittest.TestCase):
         self.assertEqual(self.map_a_to_1.process("affe"), ["1ffe"])
 
     def test_multi_map(self):
-        self.assertFalse(
-            set(self.map_b_to_1_and_2.process("baby")).
-            isdisjoint(
-                set(["1a1y", "2a2y"]))
+        self.assertListEqual(
+            self.map_b_to_1_and_2.process("baby"),
+            ["1a1y", "2a1y", "1a2y", "2a2y"]
         )
+
+    def test_multi_map_multiple_source_chars(self):
+        # The target char of the first mapped char changes most often.
+        map = Map(False, "ab", "xy").init(None, None)
+        self.assertListEqual(
+            map.process("12abc&"),
+            ["12xxc&", "12yxc&", "12xyc&", "12yyc&"]
+        )
+
+    def test_duplicate_target_chars(self):
+        map = Map(False, "ab", "xx").init(None, None)
+        self.assertListEqual(map.process("12abc&"), ["12xxc&"])
+
+    def test_single_map_not_applicable(self):
+        self.assertIsNone(self.map_a_to_1.process("test"))
+
+    def test_map_not_single_target(self):
+        map_not = Map(True, "ab", "x").init(None, None)
+        self.assertListEqual(map_not.process("12abc&"), ["xxabxx"])
+        self.assertIsNone(map_not.process("abba"))
@@ -1,6 +1,8 @@
+from functools import partial
+
 from dj_ast import ASTNode, TDUnit
 from dj_ops import PerEntryFilter
-from common import InitializationFailed
+from common import InitializationFailed, get_ascii_char_class_deletechars
 
 
 class Max(PerEntryFilter):
@@ -8,24 +10,20 @@ class Max(PerEntryFilter):
        of the specified character class.
     """
 
-    def _test_length(c: str) -> bool: return True
-    def _test_lower(c: str) -> bool: return c.islower()
-    def _test_upper(c: str) -> bool: return c.isupper()
-    def _test_numeric(c: str) -> bool: return c.isnumeric()
-    def _test_non_numeric(c: str) -> bool: return not c.isnumeric()
-    def _test_alpha(c: str) -> bool: return c.isalpha()
-    def _test_not_alpha(c: str) -> bool: return not c.isalpha()
-    def _test_symbol(c: str) -> bool: return not c.isalnum()
+    # The chars are tested using the (C-based) str predicates; the
+    # negated classes are counted using the complementary class.
+    def _count(entry: str, f) -> int: return sum(map(f, entry))
+    def _count_not(entry: str, f) -> int: return len(entry) - sum(map(f, entry))
 
     _tests = {
-        "length": _test_length,
-        "lower": _test_lower,
-        "upper": _test_upper,
-        "numeric": _test_numeric,
-        "non_numeric": _test_non_numeric,
-        "letter": _test_alpha,
-        "symbol": _test_symbol,
-        "non_letter": _test_not_alpha
+        "length": len,
+        "lower": partial(_count, f=str.islower),
+        "upper": partial(_count, f=str.isupper),
+        "numeric": partial(_count, f=str.isnumeric),
+        "non_numeric": partial(_count_not, f=str.isnumeric),
+        "letter": partial(_count, f=str.isalpha),
+        "symbol": partial(_count_not, f=str.isalnum),
+        "non_letter": partial(_count_not, f=str.isalpha)
     }
 
     def op_name() -> str: return "max"
@@ -33,6 +31,7 @@ class Max(PerEntryFilter):
     def __init__(self, operator: str, max_count: int):
         self.operator = operator
         self.test = None
+        self._ascii_deletechars = None
         self.max_count = max_count
 
     def __str__(self):
@@ -44,6 +43,9 @@ class Max(PerEntryFilter):
             self.test = self._tests[self.operator]
         except:
             raise InitializationFailed(f"{self}: unsupported operator ({', '.join(self._tests.keys())})")
+        # For ASCII entries the chars are counted by deleting all other
+        # chars using (C-based) bytes.translate.
+        self._ascii_deletechars = get_ascii_char_class_deletechars(self.operator)
         max_count = self.max_count
         if max_count < 0:
             msg = f"{self}: max {self.operator} has to be >= 0 (actual {max_count})"
@@ -51,12 +53,14 @@ class Max(PerEntryFilter):
         return self
 
     def process(self, entry: str) -> list[str]:
-        count = 0
-        for c in entry:
-            if self.test(c):
-                count += 1
-                if count > self.max_count:
-                    return []
+        # An entry cannot contain more chars of a class than chars at all.
+        if len(entry) <= self.max_count:
+            return [entry]
+        deletechars = self._ascii_deletechars
+        if deletechars is not None and entry.isascii():
+            count = len(entry.encode("ascii").translate(None, deletechars))
+        else:
+            count = self.test(entry)
+        if count > self.max_count:
+            return []
         return [entry]
-
-
@@ -51,3 +51,15 @@ class TestMax(unittest.TestCase):
         self.assertListEqual(self.mnl_2.process("BC22"), ["BC22"])
         self.assertListEqual(self.mnl_2.process("BC#'"), ["BC#'"])
         self.assertListEqual(self.mnl_2.process("BC#2"), ["BC#2"])
+
+    def test_non_ascii_chars(self):
+        self.assertListEqual(self.mlo_2.process("äöüx"), [])
+        self.assertListEqual(self.mlo_2.process("äöUX"), ["äöUX"])
+        self.assertListEqual(self.mlo_2.process("abx"), [])
+        self.assertListEqual(self.mlo_2.process("abXY"), ["abXY"])
+        self.assertListEqual(self.mup_2.process("ÄÖUx"), [])
+        self.assertListEqual(self.mle_2.process("ß1é"), ["ß1é"])
+        self.assertListEqual(self.mle_2.process("ßéa"), [])
+        self.assertListEqual(self.msy_2.process("ß€$!"), [])
+        self.assertListEqual(self.mnl_2.process("ä12"), ["ä12"])
+        self.assertListEqual(self.mnl_2.process("ä1€2"), [])
@@ -1,6 +1,7 @@
 from functools import partial
+from itertools import filterfalse, islice
 
-from common import InitializationFailed
+from common import InitializationFailed, get_ascii_char_class_deletechars
 from dj_ast import ASTNode, TDUnit
 from dj_ops import PerEntryFilter
 
@@ -14,40 +15,31 @@ class Min(PerEntryFilter):
         return [entry] if len(entry) >= min_count else []
 
     def _test_unique(entry: str, min_count: int) -> list[str]:
-        cs = set()
-        count = 0
-        for c in entry:
-            if c not in cs:
-                count += 1
-                if count >= min_count:
-                    return [entry]
-                cs.add(c)
-        return []
-
-    def _test_lower(c: str) -> bool: return c.islower()
-    def _test_upper(c: str) -> bool: return c.isupper()
-    def _test_numeric(c: str) -> bool: return c.isnumeric()
-    def _test_alpha(c: str) -> bool: return c.isalpha()
-    def _test_not_alpha(c: str) -> bool: return not c.isalpha()
-    def _test_symbol(c: str) -> bool: return not c.isalnum()
-
-    def _count(entry, min_count, f) -> list[str]:
-        count = 0
-        for c in entry:
-            if f(c):
-                count += 1
-                if count >= min_count:
-                    return [entry]
-        return []
+        return [entry] if len(set(entry)) >= min_count else []
+
+    # The chars are tested using the (C-based) str predicates; the
+    # negated classes are tested using the complementary class. The
+    # iteration stops as soon as the min_count-th char is found.
+    def _count(entry: str, min_count: int, f) -> list[str]:
+        chars = filter(f, entry)
+        if next(islice(chars, min_count-1, None), None) is None:
+            return []
+        return [entry]
+
+    def _count_not(entry: str, min_count: int, f) -> list[str]:
+        chars = filterfalse(f, entry)
+        if next(islice(chars, min_count-1, None), None) is None:
+            return []
+        return [entry]
 
     _tests = {
         "length": _test_length,
-        "lower": partial(_count, f=_test_lower),
-        "upper": partial(_count, f=_test_upper),
-        "numeric": partial(_count, f=_test_numeric),
-        "letter": partial(_count, f=_test_alpha),
-        "symbol": partial(_count, f=_test_symbol),
-        "non_letter": partial(_count, f=_test_not_alpha),
+        "lower": partial(_count, f=str.islower),
+        "upper": partial(_count, f=str.isupper),
+        "numeric": partial(_count, f=str.isnumeric),
+        "letter": partial(_count, f=str.isalpha),
+        "symbol": partial(_count_not, f=str.isalnum),
+        "non_letter": partial(_count_not, f=str.isalpha),
         "unique": _test_unique
     }
 
@@ -56,6 +48,7 @@ class Min(PerEntryFilter):
     def __init__(self, operator: str, min_count: int):
         self.operator = operator
         self.test = None
+        self._ascii_deletechars = None
         self.min_count = min_count
 
     def __str__(self):
@@ -68,11 +61,37 @@ class Min(PerEntryFilter):
         except:
             msg = f"{self}: unsupported operator ({', '.join(self._tests.keys())})"
             raise InitializationFailed(msg)
+        # For ASCII entries the chars are counted by deleting all other
+        # chars using (C-based) bytes.translate.
+        self._ascii_deletechars = get_ascii_char_class_deletechars(self.operator)
 
         if self.min_count <= 0:
             raise InitializationFailed(
                 f"{self}: min {self.operator} {self.min_count} has to be > 0")
+        if self.operator == "length":
+            # "min length" only depends on the length of the entry; hence,
+            # we can skip the generic dispatch.
+            self.process = self._process_length
+        elif self._ascii_deletechars is not None:
+            self.process = self._process_char_class
         return self
 
+    def _process_length(self, entry: str) -> list[str]:
+        return [entry] if len(entry) >= self.min_count else []
+
+    def _process_char_class(self, entry: str) -> list[str]:
+        min_count = self.min_count
+        # An entry cannot contain more chars of a class than chars at all.
+        if len(entry) < min_count:
+            return []
+        if entry.isascii():
+            deletechars = self._ascii_deletechars
+            count = len(entry.encode("ascii").translate(None, deletechars))
+            return [entry] if count >= min_count else []
+        return self.test(entry, min_count)
+
     def process(self, entry: str) -> list[str]:
-        return self.test(entry, self.min_count)
+        min_count = self.min_count
+        if len(entry) < min_count:
+            return []
+        return self.test(entry, min_count)
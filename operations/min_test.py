@@ -13,6 +13,7 @@ class TestMin(unittest.TestCase):
         self.mle_2 = Min("letter", 2).init(None, None)
         self.msy_2 = Min("symbol", 2).init(None, None)
         self.mnl_2 = Min("non_letter", 2).init(None, None)
+        self.mun_3 = Min("unique", 3).init(None, None)
 
     def test_is_filter(self):
         self.assertTrue(self.mln_2.is_filter())
@@ -60,3 +61,16 @@ class TestMin(unittest.TestCase):
         self.assertListEqual(self.mnl_2.process("BC22"), ["BC22"])
         self.assertListEqual(self.mnl_2.process("BC#'"), ["BC#'"])
         self.assertListEqual(self.mnl_2.process("BC#2"), ["BC#2"])
+
+    def test_non_ascii_chars(self):
+        self.assertListEqual(self.mlo_2.process("äöU"), ["äöU"])
+        self.assertListEqual(self.mup_2.process("ÄÖu"), ["ÄÖu"])
+        self.assertListEqual(self.mle_2.process("ß1é"), ["ß1é"])
+        self.assertListEqual(self.msy_2.process("ßé$"), [])
+        self.assertListEqual(self.mnl_2.process("ä12"), ["ä12"])
+
+    def test_unique_chars(self):
+        self.assertListEqual(self.mun_3.process("aaaa"), [])
+        self.assertListEqual(self.mun_3.process("abab"), [])
+        self.assertListEqual(self.mun_3.process("abca"), ["abca"])
+        self.assertListEqual(self.mun_3.process("äöü"), ["äöü"])
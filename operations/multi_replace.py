@@ -1,6 +1,8 @@
+import re
+
 from dj_ast import TDUnit, ASTNode
 from dj_ops import PerEntryTransformer
-from common import InitializationFailed, read_utf8file, escape
+from common import InitializationFailed, read_utf8file, escape, unescape_replacement
 
 
 class MultiReplace(PerEntryTransformer):
@@ -55,6 +57,8 @@ class MultiReplace(PerEntryTransformer):
     def __init__(self, replacements_filename):
         self.replacements_filename = replacements_filename
         self.replacement_table: dict[str, list[str]] = {}
+        # Matches any key of the replacement table; initialized by init.
+        self._re_keys = None
 
     def __str__(self):
         return f'{MultiReplace.op_name()} "{escape(self.replacements_filename)}"'
@@ -75,16 +79,8 @@ class MultiReplace(PerEntryTransformer):
             except:
                 raise InitializationFailed(
                     f"{self} contains invalid entry: {sline}")
-            key = "\\".join(
-                list(map(lambda s: s.replace("\\s", " ")
-                         .replace("\\#", "#"),
-                     raw_key.split("\\\\"))
-                     ))
-            value = "\\".join(
-                list(map(lambda s: s.replace("\\s", " ")
-                         .replace("\\#", "#"),
-                     raw_value.split("\\\\"))
-                     ))
+            key = unescape_replacement(raw_key)
+            value = unescape_replacement(raw_value)
             if key == value:
                 raise InitializationFailed(f"{self} key == value: {sline}")
             current_values = self.replacement_table.get(key)
@@ -92,28 +88,45 @@ class MultiReplace(PerEntryTransformer):
                 current_values.append(value)
             else:
                 self.replacement_table[key] = [value]
+        self._re_keys = re.compile(
+            "|".join(map(re.escape, self.replacement_table.keys())))
         return self
 
     def process(self, entry: str) -> list[str]:
+        # Most entries do not contain any key; this is checked using a
+        # single pass over the entry.
+        if not self._re_keys.search(entry):
+            return None
+
         # Initialize the table
         all = []
+        append = all.append
         all_dict: dict[int, list[str]] = {}
         for i in range(1, self.APPLY_UP_TO_N_REPLACEMENTS+1):
             all_dict[i] = []
+        first_level = all_dict[1]
+        # The levels of derived entries to which another replacement
+        # is applied; the highest level first.
+        levels = range(self.APPLY_UP_TO_N_REPLACEMENTS-1, 0, -1)
 
         for k, vs in self.replacement_table.items():
+            # If neither the entry nor any derived entry contains the key,
+            # none of the key's replacements applies.
+            if k not in entry and not any(k in e for e in all):
+                continue
             for v in vs:
-                for r in range(self.APPLY_UP_TO_N_REPLACEMENTS-1, 0, -1):
+                for r in levels:
+                    next_level = all_dict[r+1]
                     for e in all_dict[r]:
                         new_entry = e.replace(k, v)
                         if new_entry != e:
-                            all.append(new_entry)
-                            all_dict[r+1].append(new_entry)
+                            append(new_entry)
+                            next_level.append(new_entry)
 
                 new_entry = entry.replace(k, v)
                 if new_entry != entry:
-                    all.append(new_entry)
-                    all_dict[1].append(new_entry)
+                    append(new_entry)
+                    first_level.append(new_entry)
 
         if len(all) == 0:
             return None
@@ -13,24 +13,25 @@ class Number(PerEntryTransformer):
     def op_name() -> str: return "number"
 
     def __init__(self, chars_to_number: str):
-        self.chars_to_number = set(chars_to_number)
+        self.chars_to_number = frozenset(chars_to_number)
         
     def __str__(self):
         chars = "".join(self.chars_to_number)
         return f"{Number.op_name()} [{chars}]"    
 
     def process(self, entry: str) -> list[str]:
+        chars_to_number = self.chars_to_number
         count = 0
-        new_e = ""
+        parts = []
+        append = parts.append
         for e in entry:
-            if e in self.chars_to_number:
+            if e in chars_to_number:
                 count += 1
-                new_e += str(count)
+                append(str(count))
             else:
-                new_e += e
+                append(e)
 
         if count == 0:
             return None
         else:
-            return [new_e]
-
+            return ["".join(parts)]
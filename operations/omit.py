@@ -21,11 +21,9 @@ class Omit(PerEntryExtractor):
 
     def process(self, entry: str) -> list[str]:
         pos = self.pos
-        if pos >= len(entry):
+        length = len(entry)
+        if pos >= length:
             return None
-        new_entry = entry[0:pos] + entry[pos+1:len(entry)+1]
-        if len(new_entry) == 0:
+        if length == 1:
             return []
-        else:
-            return [new_entry]
-
+        return [entry[:pos] + entry[pos+1:]]
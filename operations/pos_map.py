@@ -21,6 +21,10 @@ class PosMap(PerEntryTransformer):
             Tebt
             Tesa
             Tesb
+
+        A character is not mapped to itself; i.e., the original entry
+        is never generated. If no new entry is generated, pos_map does
+        not apply.
     """
 
     def op_name() -> str: return "pos_map"
@@ -28,6 +32,13 @@ class PosMap(PerEntryTransformer):
     def __init__(self, target_chars: str):
         self.raw_target_chars = target_chars
         self.target_chars = set(target_chars)
+        # The unique target chars in the given order.
+        self._targets = tuple(dict.fromkeys(target_chars))
+        # The ordinals of the target chars if all of them are ASCII chars.
+        if target_chars.isascii():
+            self._ascii_targets = tuple(map(ord, self._targets))
+        else:
+            self._ascii_targets = None
 
     def __str__(self):
         target_chars = escape(self.raw_target_chars)
@@ -41,10 +52,34 @@ class PosMap(PerEntryTransformer):
         return self
 
     def process(self, entry: str) -> list[str]:
+        if len(entry) == 0:
+            return None
+
+        ascii_targets = self._ascii_targets
+        if ascii_targets is not None and entry.isascii():
+            # We replace the char at each position in a single (mutable)
+            # buffer; i.e., each new entry is created by one decode.
+            entries = []
+            append = entries.append
+            buffer = bytearray(entry, "ascii")
+            decode = buffer.decode
+            for i in range(0, len(buffer)):
+                c = buffer[i]
+                for t in ascii_targets:
+                    if t != c:
+                        buffer[i] = t
+                        append(decode("ascii"))
+                buffer[i] = c
+            return entries if entries else None
+
+        targets = self._targets
         entries = []
-        entry_len = len(entry)
-        for i in range(0, entry_len):
-            for c in self.target_chars:
-                entries.append(entry[0:i]+c+entry[i+1:entry_len])
+        extend = entries.extend
+        for i in range(0, len(entry)):
+            # The prefix and suffix only depend on the position.
+            prefix = entry[0:i]
+            suffix = entry[i+1:]
+            c = entry[i]
+            extend([prefix+t+suffix for t in targets if t != c])
 
-        return entries
+        return entries if entries else None
@@ -34,3 +34,19 @@ class TestPosMap(unittest.TestCase):
                 "Tesb"
             ])
         )
+
+    def test_no_identity_mapping(self):
+        self.assertListEqual(
+            PosMap("ab").process("ab"),
+            ["bb", "aa"]
+        )
+        self.assertListEqual(
+            PosMap("äb").process("äx"),
+            ["bx", "ää", "äb"]
+        )
+
+    def test_single_target_char(self):
+        posmap = PosMap("x").init(None, None)
+        self.assertListEqual(posmap.process("axb"), ["xxb", "axx"])
+        self.assertListEqual(posmap.process("äx"), ["xx"])
+        self.assertIsNone(posmap.process("xxx"))
@@ -36,16 +36,19 @@ class Prepend(PerEntryTransformer):
         if len(self.s) == 0 :
             msg = f"{self}: useless prepend operation"
             raise InitializationFailed(msg)
+        if self.prepend_each:
+            self.process = self._process_each
         return self
 
-    def process(self, entry: str) -> list[str]:
+    def _process_each(self, entry: str) -> list[str]:
         if len(entry) > 0:
-            if self.prepend_each:
-                return [self.s + (self.s.join(entry))]
-            else:
-                return [self.s + entry]
-        else: 
+            s = self.s
+            return [s + s.join(entry)]
+        else:
             return [entry]
 
-
-
+    def process(self, entry: str) -> list[str]:
+        if len(entry) > 0:
+            return [self.s + entry]
+        else:
+            return [entry]
@@ -1,4 +1,6 @@
-from contextlib import suppress
+from functools import lru_cache
+from heapq import merge
+from operator import itemgetter
 
 from dj_ast import  TDUnit, ASTNode
 from dj_ops import PerEntryTransformer
@@ -20,11 +22,18 @@ class Related(PerEntryTransformer):
     K = 5
     KEEP_ALL_RELATEDNESS = 0.75
 
+    CACHE_SIZE = 100000
+    """The maximum number of (lowercased) entries for which the related
+       terms are cached; dictionaries often contain the same term with
+       different capitalizations."""
+
     def __init__(self, MIN_RELATEDNESS: float = 0.6):
         self._twitter = None
         # self._google = None
         self._wiki = None
         self.MIN_RELATEDNESS = MIN_RELATEDNESS
+        # The cached variant of _related_terms; initialized by init.
+        self._cached_related_terms = None
 
     def __str__(self):
         return f"{Related.op_name()} {self.MIN_RELATEDNESS}"
@@ -43,9 +52,14 @@ class Related(PerEntryTransformer):
             raise InitializationFailed(
                 f"{self}: MIN_RELATEDNESS {self.MIN_RELATEDNESS} has to be in range (0,1.0)"
             )
+        self._cached_related_terms = \
+            lru_cache(maxsize=self.CACHE_SIZE)(self._related_terms)
         return self
 
     def process(self, entry: str) -> list[str]:
+        return list(self._cached_related_terms(entry.lower()))
+
+    def _related_terms(self, lentry: str) -> tuple[str]:
         if not self._twitter:
             self._twitter = get_nlp_model("twitter", self.td_unit.verbose)
         get_tms = self._twitter.most_similar
@@ -58,32 +72,38 @@ class Related(PerEntryTransformer):
             self._wiki = get_nlp_model("wiki", self.td_unit.verbose)
         get_wms = self._wiki.most_similar
 
-        lentry = entry.lower()
-        ms = []
+        tms = []
+        wms = []
 
         # recall that the twitter model only uses small letters
-        with suppress(KeyError):
-            ms = get_tms(topn=self.K*2, positive=[lentry])
+        try:
+            tms = get_tms(topn=self.K*2, positive=[lentry])
+        except KeyError:
+            pass
 
         # with suppress(KeyError): ms.extend(get_gms(topn=self.K,positive=[entry]))
 
         # recall that the wiki model only uses small letters
-        with suppress(KeyError):
-            ms.extend(get_wms(topn=Related.K*2, positive=[lentry]))
-
-        ms.sort(key=lambda e: e[1], reverse=True)
-        result = set()
+        try:
+            wms = get_wms(topn=Related.K*2, positive=[lentry])
+        except KeyError:
+            pass
+
+        # The results of most_similar are already sorted by their
+        # relatedness; hence, it is sufficient to merge them.
+        ms = merge(tms, wms, key=itemgetter(1), reverse=True)
+        # A dict is used to remove duplicates while preserving the order;
+        # i.e., the most related terms come first.
+        result = {}
         for (k, v) in ms:
             if v >= Related.KEEP_ALL_RELATEDNESS:
-                result.add(k)
+                result[k] = None
             elif v >= self.MIN_RELATEDNESS:
                 if len(result) >= Related.K:
                     break
                 else:
-                    result.add(k)
+                    result[k] = None
             else:
                 break
 
-        return list(result)
-
-
+        return tuple(result)
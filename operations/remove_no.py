@@ -1,27 +1,20 @@
-import re
-
 from dj_ops import PerEntryTransformer
 
 
 class RemoveNO(PerEntryTransformer):
-    """ Removes all numbers from an entry. 
+    """ Removes all numbers from an entry.
     """
 
     def op_name() -> str: return "remove_no"
 
-    NO_NUMBERS_REGEXP = "[^0-9]+"
-
-    def __init__(self):
-        self._re_no_numbers = re.compile(self.NO_NUMBERS_REGEXP)
+    # Deletes the digits [0-9] using str.translate.
+    _remove_numbers = str.maketrans("", "", "0123456789")
 
     def process(self, entry: str) -> list[str]:
-        entries = [
-            i.group(0)
-            for i in self._re_no_numbers.finditer(entry)
-        ]
-        if len(entries) == 0:
+        new_entry = entry.translate(RemoveNO._remove_numbers)
+        if len(new_entry) == 0:
             return []
-        elif entry != entries[0]:
-            return ["".join(entries)]
+        elif new_entry != entry:
+            return [new_entry]
         else:
             return None
@@ -1,6 +1,27 @@
 import re
+from functools import lru_cache
 
+from dj_ast import TDUnit, ASTNode
 from dj_ops import PerEntryTransformer
+from common import InitializationFailed
+
+
+@lru_cache(maxsize=None)
+def _compile_non_special_chars(regexp: str) -> tuple[re.Pattern, dict]:
+    """ Compiles the regexp that matches the non special chars and derives
+        the table to delete the special chars of ASCII entries using
+        str.translate. All instances with the same regexp share both.
+    """
+    re_non_special_char = re.compile(regexp)
+    special_ascii_chars = [
+        c
+        for c in map(chr, range(128))
+        if not re_non_special_char.fullmatch(c)
+    ]
+    return (
+        re_non_special_char,
+        str.maketrans("", "", "".join(special_ascii_chars))
+    )
 
 
 class RemoveSC(PerEntryTransformer):
@@ -19,12 +40,35 @@ class RemoveSC(PerEntryTransformer):
     # re_non_special_char = re.compile("[a-zA-Z0-9\s]+")
 
     def __init__(self):
-        self._re_non_special_char = \
-            re.compile(self.NON_SPECIAL_CHARACTERS_REGEXP)
+        # Both are initialized by init.
+        self._re_non_special_char = None
+        self._remove_ascii_sc = None
+
+    def init(self, td_unit: TDUnit, parent: ASTNode):
+        super().init(td_unit, parent)
+        # The regexp is only compiled in init to ensure that a configured
+        # NON_SPECIAL_CHARACTERS_REGEXP is taken into account.
+        try:
+            (self._re_non_special_char, self._remove_ascii_sc) = \
+                _compile_non_special_chars(self.NON_SPECIAL_CHARACTERS_REGEXP)
+        except re.error as e:
+            raise InitializationFailed(
+                f"{self}: invalid NON_SPECIAL_CHARACTERS_REGEXP: {e}")
+        return self
 
     def process(self, entry: str) -> list[str]:
-        re_non_special_char = self._re_non_special_char
-        entries = [i.group(0) for i in re_non_special_char.finditer(entry)]
+        if entry.isascii():
+            new_entry = entry.translate(self._remove_ascii_sc)
+            if len(new_entry) == 0:
+                return []
+            elif new_entry != entry:
+                return [new_entry]
+            else:
+                return None
+
+        # findall directly returns the matched strings; i.e., no match
+        # objects are created.
+        entries = self._re_non_special_char.findall(entry)
         if len(entries) == 0:
             # the entry just consisted of special chars...
             return []
@@ -0,0 +1,39 @@
+import unittest
+
+from dj_ast import TDUnit, ConfigureOperation
+from operations.remove_sc import RemoveSC
+
+
+class TestRemoveSC(unittest.TestCase):
+
+    def setUp(self):
+        self.remove_sc = RemoveSC().init(None, None)
+
+    def test_is_transformer(self):
+        self.assertTrue(self.remove_sc.is_transformer())
+
+    def test__str__(self):
+        self.assertEqual(self.remove_sc.__str__(), "remove_sc")
+
+    def test_no_special_chars(self):
+        self.assertIsNone(self.remove_sc.process("Test 123"))
+        self.assertIsNone(self.remove_sc.process("Täst"))
+
+    def test_only_special_chars(self):
+        self.assertListEqual(self.remove_sc.process("!$%"), [])
+        self.assertListEqual(self.remove_sc.process("€²³"), [])
+
+    def test_special_chars(self):
+        self.assertListEqual(self.remove_sc.process("T-e.s_t!"), ["Test"])
+        self.assertListEqual(self.remove_sc.process("T€st 1!"), ["Tst 1"])
+
+    def test_configured_non_special_characters_regexp(self):
+        self.addCleanup(
+            setattr, RemoveSC, "NON_SPECIAL_CHARACTERS_REGEXP",
+            RemoveSC.NON_SPECIAL_CHARACTERS_REGEXP)
+        config = ConfigureOperation(
+            "remove_sc", "NON_SPECIAL_CHARACTERS_REGEXP", "[a-zA-Z0-9$]+")
+        config.init(TDUnit(None, None), None)
+        remove_sc = RemoveSC().init(None, None)
+        self.assertIsNone(remove_sc.process("Te$t"))
+        self.assertListEqual(remove_sc.process("Te$t 1!"), ["Te$t1"])
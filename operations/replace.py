@@ -1,6 +1,9 @@
+import re
+from functools import lru_cache
+
 from dj_ast import TDUnit, ASTNode
 from dj_ops import PerEntryTransformer
-from common import InitializationFailed, read_utf8file, escape
+from common import InitializationFailed, read_utf8file, escape, unescape_replacement
 
 
 class Replace(PerEntryTransformer):
@@ -8,13 +11,33 @@ class Replace(PerEntryTransformer):
 
         (If you want to replace a single character by multiple other 
         characters use the "map" operation.)
+
+        The replacements are applied in the order of the file; i.e.,
+        later replacements may match text produced by earlier ones.
+        However, if a key contains another key, the longer key is
+        replaced first.
     """
 
     def op_name() -> str: return "replace"
 
+    CACHE_SIZE = 65536
+    """The maximum number of entries for which the result of applying
+       the replacements is cached; dictionaries often contain the same
+       entry multiple times after previous transformations."""
+
     def __init__(self, replacements_filename):
         self.replacements_filename = replacements_filename
         self.replacement_table: dict[str, str] = {}
+        # Matches any key of the replacement table; initialized by init.
+        self._re_keys = None
+        # The translation table if all keys and values are single chars;
+        # initialized by init.
+        self._table = None
+        # The (key, value) pairs of the replacement table in the order in
+        # which they are applied; initialized by init.
+        self._replacements = None
+        # The cached variant of _replace; initialized by init.
+        self._cached_replace = None
 
     def __str__(self):
         return f'{Replace.op_name()} "{escape(self.replacements_filename)}"'
@@ -31,16 +54,8 @@ class Replace(PerEntryTransformer):
             except:
                 raise InitializationFailed(
                     f"{self} contains invalid entry: {sline}")
-            key = "\\".join(
-                list(map(lambda s: s.replace("\\s", " ")
-                         .replace("\\#", "#"),
-                     raw_key.split("\\\\"))
-                     ))
-            value = "\\".join(
-                list(map(lambda s: s.replace("\\s", " ")
-                         .replace("\\#", "#"),
-                     raw_value.split("\\\\"))
-                     ))
+            key = unescape_replacement(raw_key)
+            value = unescape_replacement(raw_value)
 
             if self.replacement_table.get(key):
                 msg = f"{self}: {key} is already used"
@@ -51,15 +66,66 @@ class Replace(PerEntryTransformer):
                 raise InitializationFailed(msg)
 
             self.replacement_table[key] = value
+        # The replacements are applied in the order of the file, because
+        # later replacements may match text produced by earlier ones.
+        # However, a key is moved ahead of the (shorter) keys it contains
+        # to ensure that it is not (partially) replaced by the
+        # replacement of a contained key.
+        keys = []
+        for key in self.replacement_table:
+            pos = next(
+                (i for i, k in enumerate(keys) if k in key), len(keys))
+            keys.insert(pos, key)
+        self.replacement_table = {
+            k: self.replacement_table[k] for k in keys}
+        self._replacements = tuple(self.replacement_table.items())
+        self._re_keys = re.compile(
+            "|".join(map(re.escape, self.replacement_table.keys())))
+
+        # If only single chars are replaced by single chars, all
+        # replacements can be done by a single str.translate call. The
+        # replacements are applied in order; i.e., each char is mapped
+        # to the char which results from applying all replacements.
+        items = self._replacements
+        if all(len(k) == 1 and len(v) == 1 for k, v in items):
+            table = {}
+            for c in self.replacement_table.keys():
+                new_c = c
+                for k, v in items:
+                    if new_c == k:
+                        new_c = v
+                if new_c != c:
+                    table[ord(c)] = new_c
+            self._table = table
+            self.process = self._process_translate
+        else:
+            self._cached_replace = \
+                lru_cache(maxsize=self.CACHE_SIZE)(self._replace)
         return self
 
+    def _process_translate(self, entry: str) -> list[str]:
+        new_entry = entry.translate(self._table)
+        if new_entry == entry:
+            return None
+        else:
+            return [new_entry]
+
     def process(self, entry: str) -> list[str]:
-        e = entry
-        for k, v in self.replacement_table.items():
-            # RECALL:   Replace maintains object identity if there is
-            #           nothing to replace.
-            e = e.replace(k, v)
-        if entry is e:
+        # Most entries do not contain any key; this is checked using a
+        # single pass over the entry.
+        if not self._re_keys.search(entry):
+            return None
+
+        new_entry = self._cached_replace(entry)
+        # The cached result may stem from an equal but different entry
+        # object; hence, we have to compare the values.
+        if new_entry == entry:
             return None
         else:
-            return [e]
+            return [new_entry]
+
+    def _replace(self, entry: str) -> str:
+        e = entry
+        for k, v in self._replacements:
+            e = e.replace(k, v)
+        return e
@@ -0,0 +1,37 @@
+import os
+import tempfile
+import unittest
+
+from operations.replace import Replace
+
+
+class TestReplace(unittest.TestCase):
+
+    def replace(self, table: str) -> Replace:
+        fd, filename = tempfile.mkstemp(suffix=".txt", text=True)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(table)
+        self.addCleanup(os.remove, filename)
+        return Replace(filename).init(None, None)
+
+    def test_is_transformer(self):
+        self.assertTrue(self.replace("a b\n").is_transformer())
+
+    def test_no_key(self):
+        self.assertIsNone(self.replace("a b\n").process("xyz"))
+
+    def test_chained_replacements(self):
+        # later replacements are applied to the results of earlier ones
+        r = self.replace("a bc\nbc x\n")
+        self.assertListEqual(r.process("a"), ["x"])
+        self.assertListEqual(r.process("abc"), ["xx"])
+
+    def test_overlapping_keys(self):
+        # the longer key is replaced first, independent of the order
+        r = self.replace("a X\nab Y\n")
+        self.assertListEqual(r.process("abc"), ["Yc"])
+        self.assertListEqual(r.process("ac"), ["Xc"])
+
+    def test_single_chars(self):
+        r = self.replace("a b\nb c\n")
+        self.assertListEqual(r.process("ab"), ["cc"])
@@ -8,6 +8,14 @@ class Reverse(PerEntryTransformer):
     def op_name() -> str: return "reverse"
 
     def process(self, entry: str) -> list[str]:
+        if len(entry) < 2:
+            return None
+        # Most entries are not palindromes and already differ in the
+        # first and last char; in this case the comparison of the
+        # reversed entry with the entry is not necessary.
+        if entry[0] != entry[-1]:
+            return [entry[::-1]]
+
         new_entry = entry[::-1]
         if new_entry == entry:
             return None
@@ -18,10 +18,17 @@ class Rotate(PerEntryTransformer):
         return f"{Rotate.op_name()} {self.rotate_by}"
 
     def process(self, entry: str) -> list[str]:
+        rotate_by = self.rotate_by
+        # Rotating by 0 or by at least the length of the entry (the
+        # slices are not taken modulo the length) results in the entry.
+        if rotate_by == 0 or rotate_by >= len(entry):
+            return None
 
-        rotated_entry = entry[self.rotate_by:] + entry[0:self.rotate_by]
-
-        if rotated_entry != entry:
+        rotated_entry = entry[rotate_by:] + entry[:rotate_by]
+        # The rotated entry can only be equal to the entry if the
+        # first char of the entry is also the first char of the rotated
+        # entry; otherwise, the full comparison is not necessary.
+        if entry[0] != entry[rotate_by] or rotated_entry != entry:
             return [rotated_entry]
         else:
             return None
@@ -43,12 +43,16 @@ class Segments(PerEntryExtractor):
         return self
 
     def process(self, entry: str) -> list[str]:
-        if len(entry) < self.min_length:
+        entry_len = len(entry)
+        if entry_len < self.min_length:
             return None
 
+        # A segment cannot be longer than the entry; this also handles
+        # a max length of "inf".
+        max_length = min(self.max_length, entry_len)
         segments = []
-        for l in range(self.max_length, self.min_length-1, -1):
-            for i in range(0, len(entry)-l+1):
-                segments.append(entry[i:i+l])
+        extend = segments.extend
+        for l in range(max_length, self.min_length-1, -1):
+            extend([entry[i:i+l] for i in range(0, entry_len-l+1)])
 
         return segments
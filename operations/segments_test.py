@@ -29,3 +29,7 @@ class TestSegments(unittest.TestCase):
     def test_segmentation(self):
         self.assertEqual(self.S3.process("affe"), [
                          "aff", "ffe", "af", "ff", "fe", "a", "f", "f", "e"])
+
+    def test_segmentation_inf(self):
+        self.assertEqual(self.SInf.process("abc"), [
+                         "abc", "ab", "bc", "a", "b", "c"])
@@ -19,14 +19,18 @@ class Sieve(PerEntryFilter):
 
     def init(self, td_unit: TDUnit, parent: ASTNode):
         super().init(td_unit, parent)
+        chars = set(self.chars)
         for line in read_utf8file(self.sieve_filename):
             # recall that the lines are already rigth-stripped.
-            for c in line:
-                self.chars.add(c)
+            chars.update(line)
+        # The set of chars is not changed anymore.
+        self.chars = frozenset(chars)
         return self
 
     def process(self, entry: str) -> list[str]:
-        if all(c in self.chars for c in entry):
+        # issuperset tests the chars of the entry in C and stops at the
+        # first char which is not in the set.
+        if self.chars.issuperset(entry):
             return [entry]
         else:
             return []
@@ -22,14 +22,10 @@ class Split(PerEntryTransformer):
         return self
 
     def process(self, entry: str) -> list[str]:
-        if len(entry) == 0:
+        split_char = self.split_char
+        # The (C-level) containment test is much cheaper than splitting
+        # the entry and most entries do not contain the split char.
+        if split_char not in entry:
             return None
 
-        all_segments = entry.split(self.split_char)
-        # "all_segments" will have at least two elements
-        # if a split char is found.
-        if len(all_segments) == 1:
-            return None
-
-        segments = list(filter(lambda e: len(e) > 0, all_segments))
-        return segments
+        return [s for s in entry.split(split_char) if s]
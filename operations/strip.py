@@ -10,6 +10,7 @@ class Strip(PerEntryTransformer):
 
     def __init__(self,chars) -> None:
         self.chars = chars
+        self._chars_set = frozenset(chars)
 
     def __str__(self):
         return f"{Strip.op_name()} {escape(self.chars)}"
@@ -23,6 +24,11 @@ class Strip(PerEntryTransformer):
         return self
 
     def process(self, entry: str) -> list[str]:
+        # Most entries neither start nor end with a char that is stripped.
+        chars_set = self._chars_set
+        if not entry or (entry[0] not in chars_set and entry[-1] not in chars_set):
+            return None
+
         stripped_entry = entry.strip(self.chars)
         if stripped_entry is entry:
             return None
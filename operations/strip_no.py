@@ -6,9 +6,17 @@ class StripNo(PerEntryTransformer):
 
     def op_name() -> str: return "strip_no"
 
+    _DIGITS = frozenset("0123456789")
+
     def process(self, entry: str) -> list[str]:
+        # Most entries neither start nor end with a digit.
+        digits = StripNo._DIGITS
+        if not entry or (entry[0] not in digits and entry[-1] not in digits):
+            return None
+
         stripped_entry = entry.strip("0123456789")
-        if stripped_entry == entry:
+        # str.strip returns the entry itself if nothing is stripped.
+        if stripped_entry is entry:
             return None
         elif len(stripped_entry) == 0:
             # The entry just consisted of stripped entries
@@ -1,3 +1,4 @@
+from dj_ast import TDUnit, ASTNode
 from dj_ops import PerEntryTransformer
 
 
@@ -8,9 +9,27 @@ class StripNOAndSC(PerEntryTransformer):
 
     STRIP_CHARS = "0123456789<>«»“”()[]{}|‘’,;.:_#'+*~@€²³`´^°!\"§$£¥¢%&/=?µ\\- ¡¿•"
 
+    def __init__(self):
+        # The set of STRIP_CHARS; initialized by init (STRIP_CHARS can
+        # be configured).
+        self._strip_chars_set = None
+
+    def init(self, td_unit: TDUnit, parent: ASTNode):
+        super().init(td_unit, parent)
+        self._strip_chars_set = frozenset(self.STRIP_CHARS)
+        return self
+
     def process(self, entry: str) -> list[str]:
+        # Most entries neither start nor end with a char that is stripped.
+        strip_chars_set = self._strip_chars_set
+        if not entry or (
+                entry[0] not in strip_chars_set and
+                entry[-1] not in strip_chars_set):
+            return None
+
         stripped_entry = entry.strip(self.STRIP_CHARS)
-        if stripped_entry == entry:
+        # str.strip returns the entry itself if nothing is stripped.
+        if stripped_entry is entry:
             return None
         elif len(stripped_entry) == 0:
             # The entry just consisted of stripped entries
@@ -0,0 +1,39 @@
+import unittest
+
+from dj_ast import TDUnit, ConfigureOperation
+from operations.strip_no_and_sc import StripNOAndSC
+
+
+class TestStripNOAndSC(unittest.TestCase):
+
+    def setUp(self):
+        self.s = StripNOAndSC().init(None, None)
+
+    def test_is_transformer(self):
+        self.assertTrue(self.s.is_transformer())
+
+    def test__str__(self):
+        self.assertEqual(self.s.__str__(), "strip_no_and_sc")
+
+    def test_nothing_to_strip(self):
+        self.assertIsNone(self.s.process(""))
+        self.assertIsNone(self.s.process("Test"))
+        self.assertIsNone(self.s.process("T3s7!x"))
+
+    def test_only_stripped_chars(self):
+        self.assertListEqual(self.s.process("1"), [])
+        self.assertListEqual(self.s.process("«12.34»"), [])
+
+    def test_strip(self):
+        self.assertListEqual(self.s.process("123Test"), ["Test"])
+        self.assertListEqual(self.s.process("Test!!"), ["Test"])
+        self.assertListEqual(self.s.process("¡Täst 1!"), ["Täst"])
+
+    def test_configured_strip_chars(self):
+        self.addCleanup(
+            setattr, StripNOAndSC, "STRIP_CHARS", StripNOAndSC.STRIP_CHARS)
+        config = ConfigureOperation("strip_no_and_sc", "STRIP_CHARS", "x")
+        config.init(TDUnit(None, None), None)
+        s = StripNOAndSC().init(None, None)
+        self.assertIsNone(s.process("123Test"))
+        self.assertListEqual(s.process("xTestx"), ["Test"])
@@ -1,3 +1,5 @@
+import re
+
 from dj_ops import PerEntryTransformer
 
 
@@ -6,28 +8,26 @@ class StripSC(PerEntryTransformer):
 
     def op_name() -> str: return "strip_sc"
 
+    # The chars which are not alpha-numeric (str.isalnum); "\w" in
+    # addition matches "_".
+    _re_strip_sc = re.compile(r"^[\W_]+|[\W_]+$")
+
+    # For ASCII entries str.strip is used.
+    _ASCII_SC = "".join(c for c in map(chr, range(128)) if not c.isalnum())
+
     def process(self, entry: str) -> list[str]:
-        stripped_entry = entry
-
-        left = 0
-        for e in entry:
-            if not e.isalnum():
-                left += 1
-            else:
-                break
-        right = len(entry)    
-        for i in range(len(entry)-1,0,-1):
-            if not entry[i].isalnum():
-                right = i
-            else:
-                break
-
-        if right == 0:
-            return []
-        if left == 0 and right == len(entry):
+        if entry.isascii():
+            stripped_entry = entry.strip(StripSC._ASCII_SC)
+        else:
+            stripped_entry = StripSC._re_strip_sc.sub("", entry)
+        if stripped_entry == entry:
             # there were no special characters
             return None
+        elif len(stripped_entry) == 0:
+            # The entry just consisted of special characters
+            return []
+        else:
+            return [stripped_entry]
 
-        return [entry[left:right]]
 
-STRIP_SC = StripSC()
\ No newline at end of file
+STRIP_SC = StripSC()
@@ -0,0 +1,29 @@
+import unittest
+
+from operations.strip_sc import STRIP_SC
+
+
+class TestStripSC(unittest.TestCase):
+
+    def setUp(self):
+        self.strip_sc = STRIP_SC.init(None, None)
+
+    def test_is_transformer(self):
+        self.assertTrue(self.strip_sc.is_transformer())
+
+    def test__str__(self):
+        self.assertEqual(self.strip_sc.__str__(), "strip_sc")
+
+    def test_no_special_chars(self):
+        self.assertIsNone(self.strip_sc.process("Test"))
+        self.assertIsNone(self.strip_sc.process("T-e.s_t"))
+        self.assertIsNone(self.strip_sc.process("Täst"))
+
+    def test_only_special_chars(self):
+        self.assertListEqual(self.strip_sc.process("!"), [])
+        self.assertListEqual(self.strip_sc.process("_-_"), [])
+        self.assertListEqual(self.strip_sc.process("€·"), [])
+
+    def test_special_chars(self):
+        self.assertListEqual(self.strip_sc.process("!Test_1."), ["Test_1"])
+        self.assertListEqual(self.strip_sc.process("€Täst€"), ["Täst"])
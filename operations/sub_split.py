@@ -1,3 +1,5 @@
+from itertools import combinations
+
 from common import escape, InitializationFailed
 from dj_ast import ASTNode, TDUnit
 from dj_ops import PerEntryTransformer
@@ -36,26 +38,19 @@ class SubSplit(PerEntryTransformer):
         if all_segments_count == 1:
             return None
 
-        segments = list(filter(lambda e: len(e) > 0, all_segments))
+        segments = [s for s in all_segments if s]
         segments_count = len(segments)
         if segments_count == 0:
             # the entry just consisted of the split character
             return []
 
-        entries = []
-
-        def collect(current: str, remaining: list[str], take: int):
-            if take == 0:
-                entries.append(current)
-                return
-            if len(remaining) == 0 or take > len(remaining):
-                return
-
-            collect(current + remaining[0], remaining[1:], take-1)
-            collect(current, remaining[1:], take)
-
-        for i in range(1, segments_count):
-            collect("", segments, i)
-
+        # itertools.combinations enumerates the sub splits in the
+        # order of the segments; the segments are concatenated.
+        join = "".join
+        entries = [
+            join(sub_split)
+            for i in range(1, segments_count)
+            for sub_split in combinations(segments, i)
+        ]
         entries.extend(segments)
         return entries
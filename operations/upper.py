@@ -32,10 +32,15 @@ class Upper(PerEntryTransformer):
         if pos is None:
             upper = entry.upper()
         elif not self.letter_with_index:
-            if len(entry) > pos:
-                upper = entry[0:pos] + entry[pos].upper() + entry[pos+1:]
-            else:
-                upper = entry
+            if len(entry) <= pos:
+                return None
+            # Only the char at pos changes; hence, the new entry is only
+            # built (and need not be compared) if the char is changed.
+            c = entry[pos]
+            upper_c = c.upper()
+            if upper_c == c:
+                return None
+            return [entry[:pos] + upper_c + entry[pos+1:]]
         else:
             upper = ""
             i = 0